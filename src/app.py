@@ -5,120 +5,214 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
-import os
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, EmailStr
+from collections import defaultdict
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+import json
+
+# orjson serializes dict payloads several times faster than the default
+# jsonable_encoder + stdlib json path, so prefer it app-wide when installed.
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              default_response_class=ORJSONResponse if orjson is not None else JSONResponse)
+
+# Compress text responses (JSON, HTML, CSS, JS) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=6)
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds Cache-Control headers to served assets.
+
+    Assets are served with a one-hour lifetime so repeat visits hit the
+    browser cache; after expiry Starlette's ETag/Last-Modified headers let
+    conditional GETs return 304 instead of re-sending the file. Asset
+    filenames are not content-hashed, so a longer immutable lifetime would
+    make updates invisible to returning browsers.
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope,
+                                         status_code)
+        response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
 
 # Mount the static files directory
-current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
-
-# In-memory activity database
-activities = {
-    "Soccer Team": {
-        "description": "Join the school soccer team and compete in inter-school matches",
-        "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-        "max_participants": 25,
-        "participants": ["alex@mergington.edu", "sarah@mergington.edu"]
-        },
-        "Basketball Team": {
-        "description": "Practice basketball skills and participate in league games",
-        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-        "max_participants": 15,
-        "participants": ["james@mergington.edu", "lucy@mergington.edu"]
-        },
-        "Drama Club": {
-        "description": "Perform in school plays and develop acting skills",
-        "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-        "max_participants": 20,
-        "participants": ["emily@mergington.edu", "noah@mergington.edu"]
-        },
-        "Art Studio": {
-        "description": "Explore various art mediums including painting, drawing, and sculpture",
-        "schedule": "Wednesdays, 3:00 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": ["ava@mergington.edu", "liam@mergington.edu"]
-        },
-        "Science Club": {
-        "description": "Conduct experiments and participate in science competitions",
-        "schedule": "Mondays, 3:30 PM - 5:00 PM",
-        "max_participants": 18,
-        "participants": ["william@mergington.edu", "isabella@mergington.edu"]
-        },
-        "Debate Team": {
-        "description": "Develop critical thinking and public speaking through competitive debates",
-        "schedule": "Fridays, 4:00 PM - 6:00 PM",
-        "max_participants": 16,
-        "participants": ["ethan@mergington.edu", "mia@mergington.edu"]
-        },
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    }
+BASE_DIR = Path(__file__).resolve().parent
+STATIC_DIR = BASE_DIR / "static"
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+# In-memory activity database, seeded from a JSON file parsed once at import
+# (cheaper than compiling the nested literal into module bytecode).
+_seed_bytes = (BASE_DIR / "activities_seed.json").read_bytes()
+activities = orjson.loads(_seed_bytes) if orjson is not None else json.loads(_seed_bytes)
+del _seed_bytes
+
+# Participants are lists in the seed JSON; convert to sets for O(1) membership
+for _details in activities.values():
+    _details["participants"] = set(_details["participants"])
+del _details
+
+
+@app.middleware("http")
+async def redirect_root(request: Request, call_next):
+    """Redirect / to the static landing page before routing runs.
+
+    A cacheable 301 lets browsers skip the round trip entirely on repeat
+    visits, and short-circuiting in middleware avoids FastAPI routing
+    overhead for the landing hit.
+    """
+    if request.url.path == "/":
+        return Response(status_code=301,
+                        headers={"location": "/static/index.html",
+                                 "cache-control": "public, max-age=3600"})
+    return await call_next(request)
+
+
+# Reverse index mapping each student email to the activities they joined,
+# kept in sync on signup/unregister so per-student lookups are O(1) instead
+# of a scan over every activity.
+student_activities = defaultdict(set)
+
+
+def _build_student_index():
+    """(Re)build the email -> activity names index from `activities`."""
+    student_activities.clear()
+    for name, details in activities.items():
+        for email in details["participants"]:
+            student_activities[email].add(name)
+
+
+_build_student_index()
+
+
+# Immutable activity metadata (everything except participants), split out
+# once at import so rebuilding the /activities payload after a mutation only
+# touches the participant sets.
+_ACTIVITY_METADATA = {
+    name: {k: v for k, v in details.items() if k != "participants"}
+    for name, details in activities.items()
 }
 
 
-@app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
+# Cached JSON bytes for the /activities response. Reads vastly outnumber
+# writes, so the payload is serialized once and reused until a signup or
+# unregister invalidates it.
+_activities_cache = None
+
+
+def _serialize_activities():
+    """Serialize the activities dict to JSON bytes, caching the result."""
+    global _activities_cache
+    if _activities_cache is None:
+        # Participants are stored as sets for O(1) membership checks;
+        # serialize them as sorted lists so the JSON response stays stable.
+        payload = {
+            name: {**_ACTIVITY_METADATA[name],
+                   "participants": sorted(details["participants"])}
+            for name, details in activities.items()
+        }
+        # The activities dict's insertion order is the API's stable key
+        # order; serialize it as-is rather than sorting keys per response
+        # (orjson never sorts unless OPT_SORT_KEYS is passed).
+        if orjson is not None:
+            _activities_cache = orjson.dumps(payload)
+        else:
+            _activities_cache = json.dumps(payload,
+                                           sort_keys=False).encode("utf-8")
+    return _activities_cache
+
+
+def _invalidate_activities_cache():
+    global _activities_cache
+    _activities_cache = None
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities():
+    return Response(content=_serialize_activities(),
+                    media_type="application/json")
+
+
+@app.get("/students/{email}/activities")
+async def get_student_activities(email: str):
+    """List the activities a student is signed up for"""
+    return sorted(student_activities.get(email, ()))
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: EmailStr):
     """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Validate activity exists and fetch it with a single dict lookup
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
-
     # Add student
     # Validate student is not already signed up
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
-    activity["participants"].append(email)
+    # Enforce capacity server-side so clients don't have to count
+    if len(activity["participants"]) >= activity["max_participants"]:
+        raise HTTPException(status_code=409, detail="Activity is full")
+    activity["participants"].add(email)
+    student_activities[email].add(activity_name)
+    _invalidate_activities_cache()
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+class SignupBatch(BaseModel):
+    """Request body for signing up several students at once."""
+    emails: list[EmailStr]
+
+
+@app.post("/activities/{activity_name}/signup/batch")
+async def signup_batch(activity_name: str, body: SignupBatch):
+    """Sign up multiple students for an activity in a single request"""
+    # Validate activity exists and fetch it with a single dict lookup
+    activity = activities.get(activity_name)
+    if activity is None:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    # Process every email in one handler, reporting a status per entry
+    results = []
+    for email in body.emails:
+        if email in activity["participants"]:
+            results.append({"email": email, "status": "duplicate"})
+            continue
+        if len(activity["participants"]) >= activity["max_participants"]:
+            results.append({"email": email, "status": "full"})
+            continue
+        activity["participants"].add(email)
+        student_activities[email].add(activity_name)
+        results.append({"email": email, "status": "ok"})
+
+    # Invalidate once for the whole batch rather than per email
+    _invalidate_activities_cache()
+    return {"results": results}
+
+
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+async def unregister_from_activity(activity_name: str, email: EmailStr):
     """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
+    # Validate activity exists and fetch it with a single dict lookup
+    activity = activities.get(activity_name)
+    if activity is None:
         raise HTTPException(status_code=404, detail="Activity not found")
 
-    # Get the specific activity
-    activity = activities[activity_name]
-
     # Remove student
     if email not in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student not registered for this activity")
     
-    activity["participants"].remove(email)
+    activity["participants"].discard(email)
+    student_activities[email].discard(activity_name)
+    _invalidate_activities_cache()
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -5,53 +5,64 @@ Tests cover all API endpoints including:
 - GET /activities - retrieve all activities
 - POST /activities/{activity_name}/signup - sign up for an activity
 - DELETE /activities/{activity_name}/unregister - unregister from an activity
+
+Tests run in-process on the event loop via httpx.ASGITransport instead of
+TestClient's thread-per-request bridge, which keeps the suite fast.
 """
 
+import copy
+
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+import src.app
 from src.app import app, activities
 
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def client():
+    """Create an in-process async test client for the FastAPI app."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport,
+                                 base_url="http://test") as async_client:
+        yield async_client
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
+
+@pytest.fixture(scope="session")
+def original_activities():
+    """Snapshot the seed data once for the whole test session."""
+    return copy.deepcopy(activities)
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test."""
-    # Save original state
-    original_activities = {
-        name: {
-            "description": details["description"],
-            "schedule": details["schedule"],
-            "max_participants": details["max_participants"],
-            "participants": details["participants"].copy()
-        }
-        for name, details in activities.items()
-    }
-    
+def reset_activities(original_activities):
+    """Reset activities data after each test with a single snapshot swap."""
     yield
-    
+
     # Restore original state after test
-    for name, details in original_activities.items():
-        activities[name]["participants"] = details["participants"].copy()
+    activities.clear()
+    activities.update(copy.deepcopy(original_activities))
+    # Restoring mutates activities directly, so drop the cached response
+    # and rebuild the derived student index
+    src.app._invalidate_activities_cache()
+    src.app._build_student_index()
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint."""
-    
-    def test_get_activities_success(self, client):
+
+    async def test_get_activities_success(self, client):
         """Test that we can retrieve all activities."""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         data = response.json()
-        
+
         # Check that we got a dictionary of activities
         assert isinstance(data, dict)
         assert len(data) > 0
-        
+
         # Check that each activity has the required fields
         for activity_name, activity_details in data.items():
             assert "description" in activity_details
@@ -59,226 +70,361 @@ class TestGetActivities:
             assert "max_participants" in activity_details
             assert "participants" in activity_details
             assert isinstance(activity_details["participants"], list)
-    
-    def test_get_activities_contains_expected_activities(self, client):
+
+    async def test_get_activities_contains_expected_activities(self, client):
         """Test that specific activities are present."""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
-        
+
         # Check for some expected activities
         assert "Soccer Team" in data
         assert "Drama Club" in data
         assert "Programming Class" in data
 
+        # The response preserves the seed dict's insertion order
+        assert list(data) == list(activities)
+
 
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint."""
-    
-    def test_signup_success(self, client):
+
+    async def test_signup_success(self, client):
         """Test successful signup for an activity."""
         email = "newstudent@mergington.edu"
         activity_name = "Soccer Team"
-        
-        response = client.post(
+
+        response = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
-        
+
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert email in data["message"]
         assert activity_name in data["message"]
-        
+
         # Verify the participant was added
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         activities_data = activities_response.json()
         assert email in activities_data[activity_name]["participants"]
-    
-    def test_signup_duplicate_participant(self, client):
+
+    async def test_signup_duplicate_participant(self, client):
         """Test that signing up twice for the same activity fails."""
         email = "duplicate@mergington.edu"
         activity_name = "Basketball Team"
-        
+
         # First signup should succeed
-        response1 = client.post(
+        response1 = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
         assert response1.status_code == 200
-        
+
         # Second signup should fail
-        response2 = client.post(
+        response2 = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
         assert response2.status_code == 400
         assert "already signed up" in response2.json()["detail"].lower()
-    
-    def test_signup_activity_not_found(self, client):
+
+    async def test_signup_up_to_capacity(self, client):
+        """Test that signups succeed right up to max_participants."""
+        activity_name = "Chess Club"
+        max_participants = activities[activity_name]["max_participants"]
+        current = len(activities[activity_name]["participants"])
+
+        for i in range(max_participants - current):
+            response = await client.post(
+                f"/activities/{activity_name}/signup?email=filler{i}@mergington.edu"
+            )
+            assert response.status_code == 200
+
+    async def test_signup_full_activity_returns_409(self, client):
+        """Test that signing up for a full activity is rejected."""
+        activity_name = "Chess Club"
+        max_participants = activities[activity_name]["max_participants"]
+        current = len(activities[activity_name]["participants"])
+
+        # Fill the activity to capacity
+        for i in range(max_participants - current):
+            await client.post(
+                f"/activities/{activity_name}/signup?email=filler{i}@mergington.edu"
+            )
+
+        response = await client.post(
+            f"/activities/{activity_name}/signup?email=onetoomany@mergington.edu"
+        )
+
+        assert response.status_code == 409
+        assert "full" in response.json()["detail"].lower()
+
+    async def test_signup_invalid_email(self, client):
+        """Test that an invalid email is rejected before any state changes."""
+        response = await client.post(
+            "/activities/Soccer Team/signup?email=not-an-email"
+        )
+
+        assert response.status_code == 422
+
+        # Verify nothing was added
+        activities_response = await client.get("/activities")
+        activities_data = activities_response.json()
+        assert "not-an-email" not in activities_data["Soccer Team"]["participants"]
+
+    async def test_signup_activity_not_found(self, client):
         """Test signup for non-existent activity."""
         email = "student@mergington.edu"
         activity_name = "Nonexistent Activity"
-        
-        response = client.post(
+
+        response = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
-        
+
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
-    
-    def test_signup_with_special_characters(self, client):
+
+    async def test_signup_with_special_characters(self, client):
         """Test signup with email containing special characters."""
         from urllib.parse import quote
         email = "test+student@mergington.edu"
         activity_name = "Chess Club"
-        
-        response = client.post(
+
+        response = await client.post(
             f"/activities/{quote(activity_name)}/signup?email={quote(email)}"
         )
-        
+
         assert response.status_code == 200
-        
+
         # Verify the participant was added
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         activities_data = activities_response.json()
         assert email in activities_data[activity_name]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint."""
-    
-    def test_unregister_success(self, client):
+
+    async def test_unregister_success(self, client):
         """Test successful unregistration from an activity."""
         email = "test@mergington.edu"
         activity_name = "Drama Club"
-        
+
         # First sign up
-        client.post(f"/activities/{activity_name}/signup?email={email}")
-        
+        await client.post(f"/activities/{activity_name}/signup?email={email}")
+
         # Verify participant was added
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         activities_data = activities_response.json()
         assert email in activities_data[activity_name]["participants"]
-        
+
         # Now unregister
-        response = client.delete(
+        response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
-        
+
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert email in data["message"]
-        
+
         # Verify the participant was removed
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         activities_data = activities_response.json()
         assert email not in activities_data[activity_name]["participants"]
-    
-    def test_unregister_existing_participant(self, client):
+
+    async def test_unregister_existing_participant(self, client):
         """Test unregistering an existing participant."""
         activity_name = "Soccer Team"
         # Get an existing participant
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         activities_data = activities_response.json()
         email = activities_data[activity_name]["participants"][0]
-        
-        response = client.delete(
+
+        response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
-        
+
         assert response.status_code == 200
-        
+
         # Verify the participant was removed
-        activities_response = client.get("/activities")
+        activities_response = await client.get("/activities")
         activities_data = activities_response.json()
         assert email not in activities_data[activity_name]["participants"]
-    
-    def test_unregister_not_registered(self, client):
+
+    async def test_unregister_not_registered(self, client):
         """Test unregistering a participant who is not registered."""
         email = "notregistered@mergington.edu"
         activity_name = "Science Club"
-        
-        response = client.delete(
+
+        response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
-        
+
         assert response.status_code == 400
         assert "not registered" in response.json()["detail"].lower()
-    
-    def test_unregister_activity_not_found(self, client):
+
+    async def test_unregister_activity_not_found(self, client):
         """Test unregister from non-existent activity."""
         email = "student@mergington.edu"
         activity_name = "Nonexistent Activity"
-        
-        response = client.delete(
+
+        response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
-        
+
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
 
 class TestRootEndpoint:
     """Tests for GET / endpoint."""
-    
-    def test_root_redirects_to_static(self, client):
-        """Test that root endpoint redirects to static HTML."""
-        response = client.get("/", follow_redirects=False)
-        assert response.status_code == 307
+
+    async def test_root_redirects_to_static(self, client):
+        """Test that root endpoint permanently redirects to static HTML."""
+        response = await client.get("/", follow_redirects=False)
+        assert response.status_code == 301
         assert response.headers["location"] == "/static/index.html"
 
 
+class TestSignupBatch:
+    """Tests for POST /activities/{activity_name}/signup/batch endpoint."""
+
+    async def test_batch_signup_success(self, client):
+        """Test signing up several students in one request."""
+        emails = [f"batch{i}@mergington.edu" for i in range(3)]
+        activity_name = "Drama Club"
+
+        response = await client.post(
+            f"/activities/{activity_name}/signup/batch",
+            json={"emails": emails},
+        )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert all(r["status"] == "ok" for r in results)
+
+        # Verify all participants were added
+        activities_response = await client.get("/activities")
+        activities_data = activities_response.json()
+        for email in emails:
+            assert email in activities_data[activity_name]["participants"]
+
+    async def test_batch_signup_reports_duplicates(self, client):
+        """Test that already-registered students are reported, not errors."""
+        activity_name = "Chess Club"
+        emails = ["michael@mergington.edu", "batchnew@mergington.edu"]
+
+        response = await client.post(
+            f"/activities/{activity_name}/signup/batch",
+            json={"emails": emails},
+        )
+
+        assert response.status_code == 200
+        results = {r["email"]: r["status"] for r in response.json()["results"]}
+        assert results["michael@mergington.edu"] == "duplicate"
+        assert results["batchnew@mergington.edu"] == "ok"
+
+    async def test_batch_signup_activity_not_found(self, client):
+        """Test batch signup for non-existent activity."""
+        response = await client.post(
+            "/activities/Nonexistent Activity/signup/batch",
+            json={"emails": ["student@mergington.edu"]},
+        )
+
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
+
+
+class TestGetStudentActivities:
+    """Tests for GET /students/{email}/activities endpoint."""
+
+    async def test_student_activities_for_existing_participant(self, client):
+        """Test listing activities for a student from the seed data."""
+        response = await client.get("/students/michael@mergington.edu/activities")
+        assert response.status_code == 200
+        assert response.json() == ["Chess Club"]
+
+    async def test_student_activities_unknown_student(self, client):
+        """Test that an unknown student has no activities."""
+        response = await client.get("/students/unknown@mergington.edu/activities")
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_student_activities_tracks_signup_and_unregister(self, client):
+        """Test that the listing follows signups and unregistrations."""
+        email = "indexed@mergington.edu"
+
+        await client.post(f"/activities/Art Studio/signup?email={email}")
+        await client.post(f"/activities/Chess Club/signup?email={email}")
+        response = await client.get(f"/students/{email}/activities")
+        assert response.json() == ["Art Studio", "Chess Club"]
+
+        await client.delete(f"/activities/Art Studio/unregister?email={email}")
+        response = await client.get(f"/students/{email}/activities")
+        assert response.json() == ["Chess Club"]
+
+
+class TestStaticAssets:
+    """Tests for the /static file mount."""
+
+    async def test_static_assets_have_cache_control(self, client):
+        """Test that static assets are served with caching headers."""
+        response = await client.get("/static/index.html")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+
 class TestEndToEndWorkflow:
     """Integration tests for complete user workflows."""
-    
-    def test_complete_signup_and_unregister_workflow(self, client):
+
+    async def test_complete_signup_and_unregister_workflow(self, client):
         """Test a complete workflow: check activities, signup, unregister."""
         email = "workflow@mergington.edu"
         activity_name = "Art Studio"
-        
+
         # 1. Get activities and check initial state
-        response = client.get("/activities")
+        response = await client.get("/activities")
         initial_data = response.json()
         initial_count = len(initial_data[activity_name]["participants"])
-        
+
         # 2. Sign up for activity
-        signup_response = client.post(
+        signup_response = await client.post(
             f"/activities/{activity_name}/signup?email={email}"
         )
         assert signup_response.status_code == 200
-        
+
         # 3. Verify participant count increased
-        response = client.get("/activities")
+        response = await client.get("/activities")
         after_signup_data = response.json()
         after_signup_count = len(after_signup_data[activity_name]["participants"])
         assert after_signup_count == initial_count + 1
         assert email in after_signup_data[activity_name]["participants"]
-        
+
         # 4. Unregister from activity
-        unregister_response = client.delete(
+        unregister_response = await client.delete(
             f"/activities/{activity_name}/unregister?email={email}"
         )
         assert unregister_response.status_code == 200
-        
+
         # 5. Verify participant count decreased
-        response = client.get("/activities")
+        response = await client.get("/activities")
         final_data = response.json()
         final_count = len(final_data[activity_name]["participants"])
         assert final_count == initial_count
         assert email not in final_data[activity_name]["participants"]
-    
-    def test_multiple_signups_different_activities(self, client):
+
+    async def test_multiple_signups_different_activities(self, client):
         """Test signing up for multiple different activities."""
         email = "multisport@mergington.edu"
         activities_to_join = ["Soccer Team", "Basketball Team", "Gym Class"]
-        
+
         for activity_name in activities_to_join:
-            response = client.post(
+            response = await client.post(
                 f"/activities/{activity_name}/signup?email={email}"
             )
             assert response.status_code == 200
-        
+
         # Verify participant is in all activities
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         for activity_name in activities_to_join:
             assert email in data[activity_name]["participants"]